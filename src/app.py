@@ -1,14 +1,129 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from sheets_service import SheetsService
+import atexit
 import os
+import queue
+import threading
+import time
 from datetime import datetime
+from types import MappingProxyType
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+class JSONProvider(DefaultJSONProvider):
+    """Flask's JSON provider, extended to read-only mappings such as the shared test questions"""
+    
+    @staticmethod
+    def default(o):
+        if isinstance(o, MappingProxyType):
+            return dict(o)
+        return DefaultJSONProvider.default(o)
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson"""
+    
+    def dumps(self, obj, **kwargs):
+        # Datetimes are passed through to Flask's default handler so they keep the HTTP date format;
+        # non-str dict keys are converted to strings, as the stdlib provider does
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 app = Flask(__name__)
 app.secret_key = os.environ.get('SECRET_KEY', 'dev-key')
+app.json = ORJSONProvider(app) if ORJSON_AVAILABLE else JSONProvider(app)
 
 # Initialize sheets service
 sheets_service = SheetsService()
 
+# Optional Redis cache for /api/moods responses
+MOODS_LIMIT = 30
+MOODS_CACHE_KEY = f'moods:{MOODS_LIMIT}'
+MOODS_CACHE_TTL = int(os.environ.get('MOODS_CACHE_TTL', 30))
+redis_url = os.environ.get('REDIS_URL')
+cache = redis.Redis.from_url(redis_url) if REDIS_AVAILABLE and redis_url else None
+
+# Background writer: mood submissions are queued and written to Sheets in batches
+WRITE_BATCH_SIZE = 50
+WRITE_BATCH_INTERVAL = 1.0  # seconds to wait for a batch to fill
+write_queue = queue.Queue()
+
+def invalidate_moods_cache():
+    """Drop the cached /api/moods response"""
+    if cache:
+        try:
+            cache.delete(MOODS_CACHE_KEY)
+        except redis.RedisError as e:
+            app.logger.warning(f"Error invalidating moods cache: {e}")
+
+def format_timestamp(timestamp_ns):
+    """Format a time.time_ns() value as a local ISO-8601 timestamp"""
+    seconds, nanos = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanos // 1000).isoformat()
+
+def write_batch(batch):
+    """Write a batch of (timestamp_ns, mood, notes) rows to Google Sheets"""
+    written = 0
+    for timestamp_ns, mood_value, notes in batch:
+        timestamp = format_timestamp(timestamp_ns)
+        try:
+            if sheets_service.add_entry(timestamp, mood_value, notes):
+                written += 1
+            else:
+                app.logger.error(f"Failed to log mood entry from {timestamp}")
+        except Exception as e:
+            app.logger.error(f"Error logging mood entry from {timestamp}: {e}")
+    
+    if written:
+        invalidate_moods_cache()
+
+def run_writer():
+    """Drain the write queue until a None sentinel is received"""
+    running = True
+    while running:
+        batch = [write_queue.get()]
+        deadline = time.monotonic() + WRITE_BATCH_INTERVAL
+        while len(batch) < WRITE_BATCH_SIZE:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(write_queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        
+        if None in batch:
+            running = False
+            batch = [row for row in batch if row is not None]
+        if batch:
+            write_batch(batch)
+
+def stop_writer():
+    """Flush queued rows before the process exits"""
+    write_queue.put(None)
+    writer_thread.join(timeout=30)
+
+writer_thread = threading.Thread(target=run_writer, name='sheets-writer', daemon=True)
+writer_thread.start()
+atexit.register(stop_writer)
+
 @app.route('/')
 def index():
     """Main page for mood tracking"""
@@ -20,26 +135,35 @@ def submit_mood():
     data = request.json
     mood_value = data.get('mood')
     notes = data.get('notes', '')
-    timestamp = datetime.now().isoformat()
+    timestamp_ns = time.time_ns()
     
-    try:
-        # Add entry to Google Sheets
-        success = sheets_service.add_entry(timestamp, mood_value, notes)
-        if success:
-            return jsonify({'status': 'success', 'message': 'Mood logged successfully'})
-        else:
-            return jsonify({'status': 'error', 'message': 'Failed to log mood'}), 500
-    except Exception as e:
-        return jsonify({'status': 'error', 'message': str(e)}), 500
+    # Queue entry for the background Google Sheets writer, which formats the timestamp
+    write_queue.put((timestamp_ns, mood_value, notes))
+    return jsonify({'status': 'accepted', 'message': 'Mood queued for logging'}), 202
 
 @app.route('/api/moods', methods=['GET'])
 def get_moods():
     """Get recent mood entries"""
+    if cache:
+        try:
+            cached = cache.get(MOODS_CACHE_KEY)
+            if cached:
+                return Response(cached, mimetype='application/json')
+        except redis.RedisError as e:
+            app.logger.warning(f"Error reading moods cache: {e}")
+    
     try:
-        entries = sheets_service.get_recent_entries(limit=30)
-        return jsonify({'status': 'success', 'data': entries})
+        entries = sheets_service.get_recent_entries(limit=MOODS_LIMIT)
+        response = jsonify({'status': 'success', 'data': entries})
+        if cache:
+            try:
+                cache.setex(MOODS_CACHE_KEY, MOODS_CACHE_TTL, response.get_data())
+            except redis.RedisError as e:
+                app.logger.warning(f"Error writing moods cache: {e}")
+        return response
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
 if __name__ == '__main__':
-    app.run(debug=True)
+    # Development server only; run under gunicorn in production (see DEPLOYMENT.md)
+    app.run(debug=os.environ.get('DEBUG', '').lower() in ('1', 'true'))
@@ -1,19 +1,75 @@
+from collections import Counter
 from datetime import datetime, timedelta
+from itertools import chain
 from typing import Dict, List, Optional
 import json
 
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+NS_PER_DAY = 86_400_000_000_000
+_EPOCH = datetime(1970, 1, 1)
+WEEKDAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+
+def _to_ns(ts: datetime) -> int:
+    """Convert a (naive, wall-clock) datetime to integer nanoseconds since the epoch"""
+    delta = ts.replace(tzinfo=None) - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1_000
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _trend_fused(mood, stress, energy, sleep, mid):
+        """First/second-half sums of all four columns, reading each entry once"""
+        m1 = s1 = e1 = z1 = 0.0
+        m2 = s2 = e2 = z2 = 0.0
+        for i in range(mid):
+            m1 += mood[i]
+            s1 += stress[i]
+            e1 += energy[i]
+            z1 += sleep[i]
+        for i in range(mid, mood.shape[0]):
+            m2 += mood[i]
+            s2 += stress[i]
+            e2 += energy[i]
+            z2 += sleep[i]
+        return m1, m2, s1, s2, e1, e2, z1, z2
+else:
+    def _trend_fused(mood, stress, energy, sleep, mid):
+        """First/second-half sums of all four columns"""
+        return tuple(float(half.sum(dtype=np.float64))
+                     for column in (mood, stress, energy, sleep)
+                     for half in (column[:mid], column[mid:]))
+
 class MoodEntry:
     """Represents a single mood entry"""
     
+    __slots__ = ('timestamp', 'mood_score', 'notes', 'stress_level', 'energy_level',
+                 'sleep_hours', 'tags', 'tags_display')
+    
     def __init__(self, mood_score: int, notes: str = "", stress_level: int = 5, 
-                 energy_level: int = 5, sleep_hours: float = 8.0, tags: List[str] = None):
-        self.timestamp = datetime.now()
+                 energy_level: int = 5, sleep_hours: float = 8.0, tags: List[str] = None,
+                 timestamp: Optional[datetime] = None):
+        self.timestamp = timestamp or datetime.now()
         self.mood_score = mood_score  # 1-10 scale
         self.notes = notes
         self.stress_level = stress_level  # 1-10 scale
         self.energy_level = energy_level  # 1-10 scale
         self.sleep_hours = sleep_hours
-        self.tags = tags or []
+        self.tags_display = list(tags or [])  # as entered
+        self.tags = [tag.lower() for tag in self.tags_display]  # canonical, for matching
         
     def to_dict(self) -> Dict:
         """Convert mood entry to dictionary for JSON serialization"""
@@ -24,35 +80,128 @@ class MoodEntry:
             'stress_level': self.stress_level,
             'energy_level': self.energy_level,
             'sleep_hours': self.sleep_hours,
-            'tags': self.tags
+            'tags': self.tags_display
         }
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'MoodEntry':
         """Create MoodEntry from dictionary"""
-        entry = cls(
+        return cls(
             mood_score=data['mood_score'],
             notes=data.get('notes', ''),
             stress_level=data.get('stress_level', 5),
             energy_level=data.get('energy_level', 5),
             sleep_hours=data.get('sleep_hours', 8.0),
-            tags=data.get('tags', [])
+            tags=data.get('tags', []),
+            timestamp=datetime.fromisoformat(data['timestamp']) if 'timestamp' in data else None
         )
-        if 'timestamp' in data:
-            entry.timestamp = datetime.fromisoformat(data['timestamp'])
-        return entry
 
 class MoodTracker:
     """Main mood tracking functionality"""
     
-    def __init__(self, sheets_api=None):
+    _COLUMNS = ('mood_scores', 'stress_levels', 'energy_levels', 'sleep_hours',
+                'timestamps', 'weekdays', 'tags')
+    
+    def __init__(self, sheets_api=None, capacity: int = 64):
         self.entries = []
         self.sheets_api = sheets_api
         
+        # Column (SoA) storage kept parallel to self.entries, ordered by timestamp
+        self._len = 0
+        self.mood_scores = np.empty(capacity, dtype=np.float32)
+        self.stress_levels = np.empty(capacity, dtype=np.float32)
+        self.energy_levels = np.empty(capacity, dtype=np.float32)
+        self.sleep_hours = np.empty(capacity, dtype=np.float32)
+        self.timestamps = np.empty(capacity, dtype=np.int64)
+        self.weekdays = np.empty(capacity, dtype=np.int8)  # 0 = Monday
+        self.tags = np.empty(capacity, dtype=object)
+        
+        # Lowercased tag -> indices into self.entries
+        self._tag_index: Dict[str, List[int]] = {}
+    
+    def _grow(self) -> None:
+        """Double the capacity of the column arrays"""
+        cap = max(2 * len(self.timestamps), 1)
+        for name in self._COLUMNS:
+            old = getattr(self, name)
+            new = np.empty(cap, dtype=old.dtype)
+            new[:self._len] = old[:self._len]
+            setattr(self, name, new)
+    
+    def _append_columns(self, mood_entry: MoodEntry) -> bool:
+        """Write an entry into the column arrays; returns False if it breaks time order"""
+        if self._len == len(self.timestamps):
+            self._grow()
+        
+        i = self._len
+        ts = _to_ns(mood_entry.timestamp)
+        self.mood_scores[i] = mood_entry.mood_score
+        self.stress_levels[i] = mood_entry.stress_level
+        self.energy_levels[i] = mood_entry.energy_level
+        self.sleep_hours[i] = mood_entry.sleep_hours
+        self.timestamps[i] = ts
+        self.weekdays[i] = (ts // NS_PER_DAY + 3) % 7  # 1970-01-01 was a Thursday
+        self.tags[i] = mood_entry.tags
+        self._len += 1
+        
+        return i == 0 or self.timestamps[i - 1] <= ts
+    
+    def _extend_columns(self, mood_entries: List[MoodEntry]) -> bool:
+        """Bulk-write entries into the column arrays; returns False if they break time order"""
+        n = len(mood_entries)
+        scores = np.fromiter((e.mood_score for e in mood_entries), dtype=np.float32, count=n)
+        stress = np.fromiter((e.stress_level for e in mood_entries), dtype=np.float32, count=n)
+        energy = np.fromiter((e.energy_level for e in mood_entries), dtype=np.float32, count=n)
+        sleep = np.fromiter((e.sleep_hours for e in mood_entries), dtype=np.float32, count=n)
+        stamps = np.fromiter((_to_ns(e.timestamp) for e in mood_entries), dtype=np.int64, count=n)
+        
+        while self._len + n > len(self.timestamps):
+            self._grow()
+        
+        start, end = self._len, self._len + n
+        self.mood_scores[start:end] = scores
+        self.stress_levels[start:end] = stress
+        self.energy_levels[start:end] = energy
+        self.sleep_hours[start:end] = sleep
+        self.timestamps[start:end] = stamps
+        self.weekdays[start:end] = (stamps // NS_PER_DAY + 3) % 7
+        for i, entry in enumerate(mood_entries, start):
+            self.tags[i] = entry.tags
+        self._len = end
+        
+        return bool(np.all(np.diff(self.timestamps[max(start - 1, 0):end]) >= 0))
+    
+    def _sort_by_time(self) -> None:
+        """Restore chronological order of entries and columns (after out-of-order inserts)"""
+        n = self._len
+        order = np.argsort(self.timestamps[:n], kind='stable')
+        for name in self._COLUMNS:
+            column = getattr(self, name)
+            column[:n] = column[:n][order]
+        self.entries = [self.entries[i] for i in order]
+        self._rebuild_tag_index()
+    
+    def _index_tags(self, start: int) -> None:
+        """Add entries from index `start` onwards to the tag index"""
+        index = self._tag_index
+        for i in range(start, len(self.entries)):
+            for tag in set(self.entries[i].tags):
+                index.setdefault(tag, []).append(i)
+    
+    def _rebuild_tag_index(self) -> None:
+        """Rebuild the tag index from scratch"""
+        self._tag_index = {}
+        self._index_tags(0)
+        
     def add_entry(self, mood_entry: MoodEntry) -> bool:
         """Add a new mood entry"""
         try:
+            in_order = self._append_columns(mood_entry)
             self.entries.append(mood_entry)
+            if in_order:
+                self._index_tags(len(self.entries) - 1)
+            else:
+                self._sort_by_time()
             
             # Save to Google Sheets if available
             if self.sheets_api:
@@ -65,46 +214,41 @@ class MoodTracker:
     
     def get_recent_entries(self, days: int = 7) -> List[MoodEntry]:
         """Get mood entries from the last N days"""
-        cutoff_date = datetime.now() - timedelta(days=days)
-        return [entry for entry in self.entries if entry.timestamp >= cutoff_date]
+        return self.entries[self._recent_start(days):]
+    
+    def _recent_start(self, days: int) -> int:
+        """Index of the first entry within the last N days"""
+        cutoff_ns = _to_ns(datetime.now() - timedelta(days=days))
+        return int(np.searchsorted(self.timestamps[:self._len], cutoff_ns, side='left'))
     
     def get_mood_trends(self, days: int = 30) -> Dict:
         """Calculate mood trends and statistics"""
-        recent_entries = self.get_recent_entries(days)
+        start, end = self._recent_start(days), self._len
         
-        if not recent_entries:
+        if start >= end:
             return {'error': 'No entries found'}
         
-        mood_scores = [entry.mood_score for entry in recent_entries]
-        stress_levels = [entry.stress_level for entry in recent_entries]
-        energy_levels = [entry.energy_level for entry in recent_entries]
-        sleep_hours = [entry.sleep_hours for entry in recent_entries]
+        n = end - start
+        mid = n // 2
+        m1, m2, s1, s2, e1, e2, z1, z2 = _trend_fused(
+            self.mood_scores[start:end], self.stress_levels[start:end],
+            self.energy_levels[start:end], self.sleep_hours[start:end], mid)
         
         return {
-            'total_entries': len(recent_entries),
-            'avg_mood': sum(mood_scores) / len(mood_scores),
-            'avg_stress': sum(stress_levels) / len(stress_levels),
-            'avg_energy': sum(energy_levels) / len(energy_levels),
-            'avg_sleep': sum(sleep_hours) / len(sleep_hours),
-            'mood_trend': self._calculate_trend(mood_scores),
+            'total_entries': n,
+            'avg_mood': (m1 + m2) / n,
+            'avg_stress': (s1 + s2) / n,
+            'avg_energy': (e1 + e2) / n,
+            'avg_sleep': (z1 + z2) / n,
+            'mood_trend': self._classify_trend(m2 / (n - mid) - m1 / mid) if mid else 'insufficient_data',
             'date_range': {
-                'start': recent_entries[-1].timestamp.date().isoformat(),
-                'end': recent_entries[0].timestamp.date().isoformat()
+                'start': self.entries[end - 1].timestamp.date().isoformat(),
+                'end': self.entries[start].timestamp.date().isoformat()
             }
         }
     
-    def _calculate_trend(self, values: List[float]) -> str:
-        """Calculate if trend is improving, declining, or stable"""
-        if len(values) < 2:
-            return 'insufficient_data'
-        
-        # Simple trend calculation - compare first and second half averages
-        mid_point = len(values) // 2
-        first_half_avg = sum(values[:mid_point]) / mid_point
-        second_half_avg = sum(values[mid_point:]) / (len(values) - mid_point)
-        
-        diff = second_half_avg - first_half_avg
-        
+    def _classify_trend(self, diff: float) -> str:
+        """Map a second-half minus first-half average difference to a trend label"""
         if diff > 0.5:
             return 'improving'
         elif diff < -0.5:
@@ -114,7 +258,7 @@ class MoodTracker:
     
     def search_entries_by_tag(self, tag: str) -> List[MoodEntry]:
         """Search entries by tag"""
-        return [entry for entry in self.entries if tag.lower() in [t.lower() for t in entry.tags]]
+        return [self.entries[i] for i in self._tag_index.get(tag.lower(), ())]
     
     def get_mood_patterns(self) -> Dict:
         """Analyze patterns in mood data"""
@@ -122,30 +266,17 @@ class MoodTracker:
             return {'error': 'No entries found'}
         
         # Group by day of week
-        weekday_moods = {i: [] for i in range(7)}
-        for entry in self.entries:
-            weekday_moods[entry.timestamp.weekday()].append(entry.mood_score)
+        weekdays = self.weekdays[:self._len]
+        counts = np.bincount(weekdays, minlength=7)
+        sums = np.bincount(weekdays, weights=self.mood_scores[:self._len], minlength=7)
         
-        weekday_averages = {}
-        weekdays = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        
-        for i, day in enumerate(weekdays):
-            if weekday_moods[i]:
-                weekday_averages[day] = sum(weekday_moods[i]) / len(weekday_moods[i])
-            else:
-                weekday_averages[day] = None
+        weekday_averages = {
+            day: float(sums[i] / counts[i]) if counts[i] else None
+            for i, day in enumerate(WEEKDAYS)
+        }
         
         # Find most common tags
-        all_tags = []
-        for entry in self.entries:
-            all_tags.extend(entry.tags)
-        
-        tag_counts = {}
-        for tag in all_tags:
-            tag_counts[tag] = tag_counts.get(tag, 0) + 1
-        
-        # Sort by frequency
-        common_tags = sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        common_tags = Counter(chain.from_iterable(self.tags[:self._len])).most_common(10)
         
         return {
             'weekday_averages': weekday_averages,
@@ -154,15 +285,23 @@ class MoodTracker:
         }
     
     def export_data(self) -> str:
-        """Export all entries as JSON string"""
-        return json.dumps([entry.to_dict() for entry in self.entries], indent=2)
+        """Export all entries as a compact JSON string"""
+        records = [entry.to_dict() for entry in self.entries]
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(records).decode()
+        return json.dumps(records)
     
     def import_data(self, json_data: str) -> bool:
         """Import entries from JSON string"""
         try:
-            data = json.loads(json_data)
+            data = orjson.loads(json_data) if ORJSON_AVAILABLE else json.loads(json_data)
             imported_entries = [MoodEntry.from_dict(entry_data) for entry_data in data]
+            in_order = self._extend_columns(imported_entries)
             self.entries.extend(imported_entries)
+            if in_order:
+                self._index_tags(len(self.entries) - len(imported_entries))
+            else:
+                self._sort_by_time()
             return True
         except Exception as e:
             print(f"Error importing data: {e}")
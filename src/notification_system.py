@@ -4,19 +4,111 @@ Notification System Module
 Provides notification functionality for mood tracking reminders and alerts.
 """
 
+import queue
 import smtplib
-import schedule
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from email.message import EmailMessage
 from typing import List, Dict, Optional
 
+from apscheduler.schedulers.background import BackgroundScheduler
+
+
+# Message templates, built once at import time
+REMINDER_SUBJECT = "Daily Mood Tracking Reminder"
+REMINDER_MESSAGE = """
+Hi there!
+
+This is your daily reminder to track your mood. 
+
+Taking a few minutes to reflect on your mental state can help you:
+- Identify patterns in your mood
+- Track your progress over time
+- Better understand what affects your wellbeing
+
+Please visit your mood tracker to log today's entry.
+
+Take care,
+Your Mood Tracker Team
+        """
+
+WEEKLY_SUMMARY_SUBJECT = "Your Weekly Mood Summary"
+WEEKLY_SUMMARY_TEMPLATE = """
+Hi there!
+
+Here's your weekly mood summary:
+
+📊 This Week's Statistics:
+- Total mood entries: {entries_count}
+- Average mood rating: {avg_mood}
+- Most common mood: {dominant_mood}
+
+💡 Insights:
+- You logged {entries_count} mood entries this week
+- Your average mood was {avg_mood} out of 10
+
+Keep up the great work tracking your mental health!
+
+Best regards,
+Your Mood Tracker Team
+        """
+
+LOW_MOOD_SUBJECT = "Mood Tracker - Wellness Check"
+LOW_MOOD_TEMPLATE = """
+Hi,
+
+We noticed your mood has been lower than usual over the past few days.
+
+Average mood: {avg_mood}
+Duration: {duration} days
+
+Remember:
+- It's normal to have ups and downs
+- Consider reaching out to friends, family, or a mental health professional
+- Take care of your basic needs: sleep, nutrition, exercise
+
+You're not alone. Take care of yourself.
+
+Best regards,
+Your Mood Tracker Team
+            """
+
+MISSING_ENTRIES_SUBJECT = "Mood Tracker - Missing Entries Reminder"
+MISSING_ENTRIES_TEMPLATE = """
+Hi,
+
+We noticed you haven't logged your mood in {days_missing} days.
+
+Consistent tracking helps you:
+- Identify patterns and triggers
+- Monitor your mental health progress
+- Make informed decisions about your wellbeing
+
+We're here when you're ready to continue your journey.
+
+Best regards,
+Your Mood Tracker Team
+            """
+
+
+def _is_stale_connection(error: OSError) -> bool:
+    """
+    Whether a send failed because the SMTP session was dropped, e.g. an idle
+    pooled connection closed by the server ("421 timeout exceeded").
+    """
+    if isinstance(error, smtplib.SMTPServerDisconnected):
+        return True
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code == 421
+    # Socket-level errors; other SMTP errors are OSError subclasses too
+    return not isinstance(error, smtplib.SMTPException)
+
 
 class NotificationSystem:
     """Class for managing notifications and reminders."""
     
-    def __init__(self, email_config: Dict[str, str] = None):
+    def __init__(self, email_config: Dict[str, str] = None, max_workers: int = 8):
         """
         Initialize notification system.
         
@@ -26,9 +118,15 @@ class NotificationSystem:
                 - smtp_port: SMTP server port
                 - sender_email: Sender email address
                 - sender_password: Sender email password
+            max_workers: Number of concurrent senders used by broadcast()
         """
         self.email_config = email_config or {}
         self.scheduled_notifications = []
+        self.max_workers = max_workers
+        self._smtp_pool = queue.Queue()  # idle, authenticated SMTP connections
+        self._executor = None
+        self._scheduler = BackgroundScheduler()
+        self._stop_event = threading.Event()
     
     def send_email_notification(self, recipient: str, subject: str, message: str) -> bool:
         """
@@ -47,49 +145,127 @@ class NotificationSystem:
             return False
         
         try:
-            msg = MIMEMultipart()
+            msg = EmailMessage()
             msg['From'] = self.email_config.get('sender_email')
             msg['To'] = recipient
             msg['Subject'] = subject
+            msg.set_content(message)
             
-            msg.attach(MIMEText(message, 'plain'))
-            
-            server = smtplib.SMTP(
-                self.email_config.get('smtp_server'),
-                int(self.email_config.get('smtp_port', 587))
-            )
-            server.starttls()
-            server.login(
-                self.email_config.get('sender_email'),
-                self.email_config.get('sender_password')
-            )
-            
-            text = msg.as_string()
-            server.sendmail(
-                self.email_config.get('sender_email'),
-                recipient,
-                text
-            )
-            server.quit()
-            
+            self._send_with_pooled(msg)
             return True
             
         except Exception as e:
             print(f"Error sending email: {e}")
             return False
     
+    def broadcast(self, recipients: List[str], subject: str, message: str) -> List[bool]:
+        """
+        Send the same email to many recipients concurrently.
+        
+        Args:
+            recipients: Recipient email addresses
+            subject: Email subject
+            message: Email message body
+        
+        Returns:
+            List[bool]: Send result for each recipient, in order
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        
+        return list(self._executor.map(
+            lambda recipient: self.send_email_notification(recipient, subject, message),
+            recipients
+        ))
+    
+    def _connect(self) -> smtplib.SMTP:
+        """
+        Open a new authenticated SMTP connection.
+        
+        Returns:
+            smtplib.SMTP: Authenticated SMTP connection
+        """
+        server = smtplib.SMTP(
+            self.email_config.get('smtp_server'),
+            int(self.email_config.get('smtp_port', 587))
+        )
+        server.starttls()
+        server.login(
+            self.email_config.get('sender_email'),
+            self.email_config.get('sender_password')
+        )
+        return server
+    
+    def _send_with_pooled(self, msg: EmailMessage) -> None:
+        """
+        Send a message over a pooled SMTP connection, reconnecting once if it went stale
+        (disconnected, a 421 reply, or a socket error).
+        
+        Args:
+            msg: Message to send
+        """
+        try:
+            server = self._smtp_pool.get_nowait()
+        except queue.Empty:
+            server = self._connect()
+        
+        try:
+            try:
+                server.send_message(msg)
+            except OSError as e:
+                if not _is_stale_connection(e):
+                    raise
+                try:
+                    server.close()
+                except OSError:
+                    pass
+                server = self._connect()
+                server.send_message(msg)
+        except Exception:
+            try:
+                server.close()
+            except Exception:
+                pass
+            raise
+        
+        self._smtp_pool.put(server)
+    
+    def close(self) -> None:
+        """
+        Stop the broadcast workers and close all pooled SMTP connections.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        
+        while True:
+            try:
+                server = self._smtp_pool.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                server.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+    
     def schedule_daily_reminder(self, time_str: str, recipient: str) -> None:
         """
         Schedule daily mood tracking reminder.
         
         Args:
-            time_str: Time in format 'HH:MM'
+            time_str: Time in format 'HH:MM' (or 'HH:MM:SS')
             recipient: Email address to send reminder
         """
-        schedule.every().day.at(time_str).do(
+        hour, minute, second = (time_str.split(':') + ['0'])[:3]
+        job = self._scheduler.add_job(
             self.send_mood_reminder,
-            recipient=recipient
+            'cron',
+            hour=int(hour),
+            minute=int(minute),
+            second=int(second),
+            args=[recipient]
         )
+        self.scheduled_notifications.append(job)
     
     def send_mood_reminder(self, recipient: str) -> bool:
         """
@@ -101,24 +277,7 @@ class NotificationSystem:
         Returns:
             bool: True if reminder sent successfully
         """
-        subject = "Daily Mood Tracking Reminder"
-        message = """
-Hi there!
-
-This is your daily reminder to track your mood. 
-
-Taking a few minutes to reflect on your mental state can help you:
-- Identify patterns in your mood
-- Track your progress over time
-- Better understand what affects your wellbeing
-
-Please visit your mood tracker to log today's entry.
-
-Take care,
-Your Mood Tracker Team
-        """
-        
-        return self.send_email_notification(recipient, subject, message)
+        return self.send_email_notification(recipient, REMINDER_SUBJECT, REMINDER_MESSAGE)
     
     def send_weekly_summary(self, recipient: str, mood_data: Dict) -> bool:
         """
@@ -131,34 +290,13 @@ Your Mood Tracker Team
         Returns:
             bool: True if summary sent successfully
         """
-        subject = "Your Weekly Mood Summary"
-        
-        # Calculate basic statistics
-        avg_mood = mood_data.get('average_mood', 'N/A')
-        entries_count = mood_data.get('entries_count', 0)
-        dominant_mood = mood_data.get('dominant_mood', 'N/A')
-        
-        message = f"""
-Hi there!
-
-Here's your weekly mood summary:
-
-📊 This Week's Statistics:
-- Total mood entries: {entries_count}
-- Average mood rating: {avg_mood}
-- Most common mood: {dominant_mood}
-
-💡 Insights:
-- You logged {entries_count} mood entries this week
-- Your average mood was {avg_mood} out of 10
-
-Keep up the great work tracking your mental health!
-
-Best regards,
-Your Mood Tracker Team
-        """
+        message = WEEKLY_SUMMARY_TEMPLATE.format(
+            entries_count=mood_data.get('entries_count', 0),
+            avg_mood=mood_data.get('average_mood', 'N/A'),
+            dominant_mood=mood_data.get('dominant_mood', 'N/A')
+        )
         
-        return self.send_email_notification(recipient, subject, message)
+        return self.send_email_notification(recipient, WEEKLY_SUMMARY_SUBJECT, message)
     
     def send_alert_notification(self, recipient: str, alert_type: str, data: Dict) -> bool:
         """
@@ -173,43 +311,17 @@ Your Mood Tracker Team
             bool: True if alert sent successfully
         """
         if alert_type == 'low_mood':
-            subject = "Mood Tracker - Wellness Check"
-            message = f"""
-Hi,
-
-We noticed your mood has been lower than usual over the past few days.
-
-Average mood: {data.get('avg_mood', 'N/A')}
-Duration: {data.get('duration', 'N/A')} days
-
-Remember:
-- It's normal to have ups and downs
-- Consider reaching out to friends, family, or a mental health professional
-- Take care of your basic needs: sleep, nutrition, exercise
-
-You're not alone. Take care of yourself.
-
-Best regards,
-Your Mood Tracker Team
-            """
+            subject = LOW_MOOD_SUBJECT
+            message = LOW_MOOD_TEMPLATE.format(
+                avg_mood=data.get('avg_mood', 'N/A'),
+                duration=data.get('duration', 'N/A')
+            )
             
         elif alert_type == 'missing_entries':
-            subject = "Mood Tracker - Missing Entries Reminder"
-            message = f"""
-Hi,
-
-We noticed you haven't logged your mood in {data.get('days_missing', 'several')} days.
-
-Consistent tracking helps you:
-- Identify patterns and triggers
-- Monitor your mental health progress
-- Make informed decisions about your wellbeing
-
-We're here when you're ready to continue your journey.
-
-Best regards,
-Your Mood Tracker Team
-            """
+            subject = MISSING_ENTRIES_SUBJECT
+            message = MISSING_ENTRIES_TEMPLATE.format(
+                days_missing=data.get('days_missing', 'several')
+            )
         else:
             subject = "Mood Tracker - Notification"
             message = "You have a new notification from your mood tracker."
@@ -219,18 +331,28 @@ Your Mood Tracker Team
     def run_scheduler(self) -> None:
         """
         Run the notification scheduler.
-        Call this method to start processing scheduled notifications.
+        Call this method to start processing scheduled notifications;
+        it blocks until stop_scheduler() is called.
         """
         print("Starting notification scheduler...")
-        while True:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute
+        self._stop_event.clear()
+        self._scheduler.start()
+        try:
+            self._stop_event.wait()
+        finally:
+            self._scheduler.shutdown(wait=False)
+    
+    def stop_scheduler(self) -> None:
+        """
+        Stop a running scheduler and unblock run_scheduler().
+        """
+        self._stop_event.set()
     
     def clear_scheduled_notifications(self) -> None:
         """
         Clear all scheduled notifications.
         """
-        schedule.clear()
+        self._scheduler.remove_all_jobs()
         self.scheduled_notifications = []
         print("All scheduled notifications cleared")
     
@@ -241,4 +363,4 @@ Your Mood Tracker Team
         Returns:
             List of scheduled jobs
         """
-        return schedule.jobs
+        return self._scheduler.get_jobs()
@@ -4,7 +4,60 @@ Psychological Tests Module
 Provides various psychological assessments and tests for mood tracking.
 """
 
-from typing import Dict, List, Any
+from bisect import bisect_left
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Tuple
+
+import numpy as np
+
+_TWO_WEEKS_SCALE = 'Over the last 2 weeks, how often have you been bothered by:'
+_PAST_WEEK_SCALE = 'Please read each statement and select how much it applied to you over the past week'
+
+# Question tables are shared by all PsychologicalTests instances, so each question is a
+# read-only mapping (convert with dict() where a plain dict is needed, e.g. for JSON)
+PHQ9_QUESTIONS = (
+    MappingProxyType({'id': 1, 'question': 'Little interest or pleasure in doing things', 'scale': _TWO_WEEKS_SCALE}),
+    MappingProxyType({'id': 2, 'question': 'Feeling down, depressed, or hopeless', 'scale': _TWO_WEEKS_SCALE}),
+    MappingProxyType({'id': 3, 'question': 'Trouble falling or staying asleep, or sleeping too much', 'scale': _TWO_WEEKS_SCALE}),
+    MappingProxyType({'id': 4, 'question': 'Feeling tired or having little energy', 'scale': _TWO_WEEKS_SCALE}),
+    MappingProxyType({'id': 5, 'question': 'Poor appetite or overeating', 'scale': _TWO_WEEKS_SCALE}),
+)
+
+GAD7_QUESTIONS = (
+    MappingProxyType({'id': 1, 'question': 'Feeling nervous, anxious, or on edge', 'scale': _TWO_WEEKS_SCALE}),
+    MappingProxyType({'id': 2, 'question': 'Not being able to stop or control worrying', 'scale': _TWO_WEEKS_SCALE}),
+    MappingProxyType({'id': 3, 'question': 'Worrying too much about different things', 'scale': _TWO_WEEKS_SCALE}),
+)
+
+# DASS-21 Stress Assessment questions (subset)
+DASS21_QUESTIONS = (
+    MappingProxyType({'id': 1, 'question': 'I found it hard to wind down', 'scale': _PAST_WEEK_SCALE}),
+    MappingProxyType({'id': 2, 'question': 'I was aware of dryness of my mouth', 'scale': _PAST_WEEK_SCALE}),
+)
+
+# Score interpretation tables: (inclusive upper bounds, severity labels, interpretation format)
+_PHQ9 = ((4, 9, 14, 19),
+         ('Minimal', 'Mild', 'Moderate', 'Moderately Severe', 'Severe'),
+         'PHQ-9 Depression Score: %s (%s)')
+_GAD7 = ((4, 9, 14),
+         ('Minimal', 'Mild', 'Moderate', 'Severe'),
+         'GAD-7 Anxiety Score: %s (%s)')
+_DASS21 = ((7, 9, 12, 16),
+           ('Normal', 'Mild', 'Moderate', 'Severe', 'Extremely Severe'),
+           'DASS-21 Stress Score: %s (%s)')
+
+_TABLES = {'phq9': _PHQ9, 'gad7': _GAD7, 'dass21': _DASS21}
+
+
+def _interpret(score: int, table: tuple) -> Dict[str, Any]:
+    """Look up the severity band for a score in an interpretation table."""
+    bounds, labels, fmt = table
+    severity = labels[bisect_left(bounds, score)]
+    return {
+        'score': score,
+        'severity': severity,
+        'interpretation': fmt % (score, severity)
+    }
 
 
 class PsychologicalTests:
@@ -12,79 +65,14 @@ class PsychologicalTests:
     
     def __init__(self):
         self.tests = {
-            'phq9': self._phq9_questions(),
-            'gad7': self._gad7_questions(),
-            'dass21': self._dass21_questions()
+            'phq9': PHQ9_QUESTIONS,
+            'gad7': GAD7_QUESTIONS,
+            'dass21': DASS21_QUESTIONS
         }
     
-    def _phq9_questions(self) -> List[Dict[str, Any]]:
-        """PHQ-9 Depression Assessment questions."""
-        return [
-            {
-                'id': 1,
-                'question': 'Little interest or pleasure in doing things',
-                'scale': 'Over the last 2 weeks, how often have you been bothered by:'
-            },
-            {
-                'id': 2,
-                'question': 'Feeling down, depressed, or hopeless',
-                'scale': 'Over the last 2 weeks, how often have you been bothered by:'
-            },
-            {
-                'id': 3,
-                'question': 'Trouble falling or staying asleep, or sleeping too much',
-                'scale': 'Over the last 2 weeks, how often have you been bothered by:'
-            },
-            {
-                'id': 4,
-                'question': 'Feeling tired or having little energy',
-                'scale': 'Over the last 2 weeks, how often have you been bothered by:'
-            },
-            {
-                'id': 5,
-                'question': 'Poor appetite or overeating',
-                'scale': 'Over the last 2 weeks, how often have you been bothered by:'
-            }
-        ]
-    
-    def _gad7_questions(self) -> List[Dict[str, Any]]:
-        """GAD-7 Anxiety Assessment questions."""
-        return [
-            {
-                'id': 1,
-                'question': 'Feeling nervous, anxious, or on edge',
-                'scale': 'Over the last 2 weeks, how often have you been bothered by:'
-            },
-            {
-                'id': 2,
-                'question': 'Not being able to stop or control worrying',
-                'scale': 'Over the last 2 weeks, how often have you been bothered by:'
-            },
-            {
-                'id': 3,
-                'question': 'Worrying too much about different things',
-                'scale': 'Over the last 2 weeks, how often have you been bothered by:'
-            }
-        ]
-    
-    def _dass21_questions(self) -> List[Dict[str, Any]]:
-        """DASS-21 Stress Assessment questions (subset)."""
-        return [
-            {
-                'id': 1,
-                'question': 'I found it hard to wind down',
-                'scale': 'Please read each statement and select how much it applied to you over the past week'
-            },
-            {
-                'id': 2,
-                'question': 'I was aware of dryness of my mouth',
-                'scale': 'Please read each statement and select how much it applied to you over the past week'
-            }
-        ]
-    
-    def get_test(self, test_name: str) -> List[Dict[str, Any]]:
-        """Get questions for a specific test."""
-        return self.tests.get(test_name, [])
+    def get_test(self, test_name: str) -> Tuple[Mapping[str, Any], ...]:
+        """Get questions for a specific test (shared, read-only mappings)."""
+        return self.tests.get(test_name, ())
     
     def calculate_score(self, test_name: str, responses: List[int]) -> Dict[str, Any]:
         """Calculate score for a completed test."""
@@ -99,57 +87,49 @@ class PsychologicalTests:
         
         return {'score': total_score, 'interpretation': 'Unknown test'}
     
-    def _interpret_phq9_score(self, score: int) -> Dict[str, Any]:
-        """Interpret PHQ-9 depression score."""
-        if score <= 4:
-            severity = 'Minimal'
-        elif score <= 9:
-            severity = 'Mild'
-        elif score <= 14:
-            severity = 'Moderate'
-        elif score <= 19:
-            severity = 'Moderately Severe'
-        else:
-            severity = 'Severe'
+    def calculate_scores_batch(self, test_name: str, responses: Any) -> Dict[str, Any]:
+        """
+        Calculate scores for many respondents at once.
         
+        Args:
+            test_name: Test identifier ('phq9', 'gad7', 'dass21')
+            responses: 2-D array-like of responses, one row per respondent
+        
+        Returns:
+            Dict with 'score' and 'severity' arrays, aligned with the input rows
+        
+        Raises:
+            ValueError: If responses is not 2-D (one row of answers per respondent)
+        """
+        responses = np.asarray(responses)
+        if responses.ndim == 1 and responses.size == 0:
+            responses = responses.reshape(0, 0)  # no respondents
+        if responses.ndim != 2:
+            raise ValueError(
+                f"responses must be 2-D (one row per respondent), got {responses.ndim}-D"
+            )
+        
+        # Summed in the input's own dtype, so non-integer answers band as in calculate_score
+        totals = responses.sum(axis=1)
+        
+        table = _TABLES.get(test_name)
+        if table is None:
+            return {'score': totals, 'interpretation': 'Unknown test'}
+        
+        bounds, labels, _ = table
         return {
-            'score': score,
-            'severity': severity,
-            'interpretation': f'PHQ-9 Depression Score: {score} ({severity})'
+            'score': totals,
+            'severity': np.asarray(labels)[np.digitize(totals, bounds, right=True)]
         }
     
+    def _interpret_phq9_score(self, score: int) -> Dict[str, Any]:
+        """Interpret PHQ-9 depression score."""
+        return _interpret(score, _PHQ9)
+    
     def _interpret_gad7_score(self, score: int) -> Dict[str, Any]:
         """Interpret GAD-7 anxiety score."""
-        if score <= 4:
-            severity = 'Minimal'
-        elif score <= 9:
-            severity = 'Mild'
-        elif score <= 14:
-            severity = 'Moderate'
-        else:
-            severity = 'Severe'
-        
-        return {
-            'score': score,
-            'severity': severity,
-            'interpretation': f'GAD-7 Anxiety Score: {score} ({severity})'
-        }
+        return _interpret(score, _GAD7)
     
     def _interpret_dass21_score(self, score: int) -> Dict[str, Any]:
         """Interpret DASS-21 stress score."""
-        if score <= 7:
-            severity = 'Normal'
-        elif score <= 9:
-            severity = 'Mild'
-        elif score <= 12:
-            severity = 'Moderate'
-        elif score <= 16:
-            severity = 'Severe'
-        else:
-            severity = 'Extremely Severe'
-        
-        return {
-            'score': score,
-            'severity': severity,
-            'interpretation': f'DASS-21 Stress Score: {score} ({severity})'
-        }
+        return _interpret(score, _DASS21)
@@ -1,11 +1,29 @@
 import os
 import json
-from datetime import datetime
-from typing import List, Dict, Optional
+import random
+import asyncio
+import atexit
+import csv
+import gzip
+import socket
+import tempfile
+import threading
+import time
+import warnings
+import weakref
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from operator import attrgetter
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import quote
 
 try:
+    import httplib2
     from googleapiclient.discovery import build
+    from googleapiclient.errors import HttpError
     from google.auth.transport.requests import Request
+    from google_auth_httplib2 import AuthorizedHttp
     from google.oauth2.credentials import Credentials
     from google_auth_oauthlib.flow import InstalledAppFlow
     GOOGLE_API_AVAILABLE = True
@@ -13,17 +31,300 @@ except ImportError:
     GOOGLE_API_AVAILABLE = False
     print("Google API libraries not installed. Google Sheets integration disabled.")
 
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Entry fields, in sheet column order (A:I)
+_COLUMNS = ('timestamp', 'date', 'time', 'mood_score', 'stress_level', 'energy_level',
+            'sleep_hours', 'notes', 'tags')
+
+# Header row written to new sheets
+_HEADERS = ('Timestamp', 'Date', 'Time', 'Mood Score', 'Stress Level',
+            'Energy Level', 'Sleep Hours', 'Notes', 'Tags')
+
+# Parquet schema of sheet snapshots: the raw cell strings, null for missing trailing cells
+_SNAPSHOT_SCHEMA = pa.schema([(column, pa.string()) for column in _COLUMNS]) if PYARROW_AVAILABLE else None
+
+# Rows per Parquet row group; small enough that date-range reads can skip whole groups
+_SNAPSHOT_ROW_GROUP_SIZE = 1000
+
+# Below this many rows the plain Python parser is faster than building a DataFrame
+_PANDAS_MIN_ROWS = 1000
+
+
+class MoodRow:
+    """One parsed sheet row; a lighter-weight stand-in for a per-row dict
+    
+    Fields are read as attributes (row.date). Code that needs the dict form
+    (indexing, JSON serialization) should call as_dict().
+    """
+    
+    __slots__ = _COLUMNS
+    
+    def __init__(self, timestamp: str, date: str, time: str, mood_score: int, stress_level: int,
+                 energy_level: int, sleep_hours: float, notes: str, tags: List[str]):
+        self.timestamp = timestamp
+        self.date = date
+        self.time = time
+        self.mood_score = mood_score
+        self.stress_level = stress_level
+        self.energy_level = energy_level
+        self.sleep_hours = sleep_hours
+        self.notes = notes
+        self.tags = tags
+    
+    def as_dict(self) -> Dict:
+        """Convert to the dictionary form returned by earlier versions (e.g. for json.dumps)"""
+        return {column: getattr(self, column) for column in _COLUMNS}
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, MoodRow):
+            return NotImplemented
+        return all(getattr(self, column) == getattr(other, column) for column in _COLUMNS)
+    
+    def __repr__(self) -> str:
+        return f"MoodRow({', '.join(f'{column}={getattr(self, column)!r}' for column in _COLUMNS)})"
+
+
+# Entry attributes written to a row, in column order (date and time are derived from timestamp)
+_ROW_FIELDS = attrgetter('timestamp', 'mood_score', 'stress_level', 'energy_level',
+                         'sleep_hours', 'notes', 'tags_display')
+
+
+def _entry_to_row(mood_entry) -> List:
+    """Convert a mood entry to sheet row data"""
+    timestamp, mood, stress, energy, sleep, notes, tags = _ROW_FIELDS(mood_entry)
+    # Date and time columns are slices of the ISO timestamp: YYYY-MM-DDTHH:MM:SS[.ffffff]
+    iso = timestamp.isoformat()
+    return [iso, iso[:10], iso[11:19], mood, stress, energy, sleep, notes,
+            ', '.join(tags) if tags else '']
+
+
+def _entries_to_rows(mood_entries: List) -> List[List]:
+    """Convert many mood entries to sheet rows; _entry_to_row inlined for large batches"""
+    rows = []
+    append = rows.append
+    for timestamp, mood, stress, energy, sleep, notes, tags in map(_ROW_FIELDS, mood_entries):
+        iso = timestamp.isoformat()
+        append([iso, iso[:10], iso[11:19], mood, stress, energy, sleep, notes,
+                ', '.join(tags) if tags else ''])
+    return rows
+
+
+def _int_or(default: int):
+    """Parser for an integer cell, falling back to `default` for anything but plain ASCII digits"""
+    def parse(value: str) -> int:
+        # isdigit() alone also accepts e.g. '²' (which int() rejects) and '٣'
+        return int(value) if value.isascii() and value.isdigit() else default
+    return parse
+
+
+def _float_or(default: float):
+    """Parser for a decimal cell, falling back to `default` (also for malformed ones like '1.2.3')"""
+    def parse(value: str) -> float:
+        if not (value.isascii() and value.replace('.', '').isdigit()):
+            return default
+        try:
+            return float(value)
+        except ValueError:
+            return default
+    return parse
+
+
+def _split_tags(value: str) -> List[str]:
+    """Parser for the comma-separated tags cell"""
+    return [tag.strip() for tag in value.split(',')] if value else []
+
+
+# Right-padding for rows with missing trailing cells: row + _PAD[len(row):] has all columns
+_PAD = [''] * len(_COLUMNS)
+
+# Parsers for the typed cells (mood, stress, energy, sleep, tags); missing cells are parsed as ''
+_PARSERS = (_int_or(0), _int_or(5), _int_or(5), _float_or(8.0), _split_tags)
+
+
+def _parse_rows(data_rows: List[List]) -> List[MoodRow]:
+    """Convert sheet data rows (without the header) to MoodRow objects"""
+    if PANDAS_AVAILABLE and len(data_rows) >= _PANDAS_MIN_ROWS:
+        return _parse_rows_pandas(data_rows)
+    
+    parse_mood, parse_stress, parse_energy, parse_sleep, parse_tags = _PARSERS
+    entries = []
+    append = entries.append
+    for row in data_rows:
+        if len(row) >= 4:  # Minimum required columns
+            timestamp, date, time, mood, stress, energy, sleep, notes, tags = row + _PAD[len(row):]
+            append(MoodRow(timestamp, date, time, parse_mood(mood), parse_stress(stress),
+                           parse_energy(energy), parse_sleep(sleep), notes, parse_tags(tags)))
+    
+    return entries
+
+
+def _parse_rows_pandas(data_rows: List[List]) -> List[MoodRow]:
+    """Vectorized equivalent of _parse_rows for large sheets"""
+    df = pd.DataFrame(data_rows).reindex(columns=range(len(_COLUMNS)))
+    df.columns = list(_COLUMNS)
+    df = df[df['mood_score'].notna()]  # Minimum required columns
+    
+    for column in ('timestamp', 'date', 'time', 'notes', 'tags'):
+        df[column] = df[column].fillna('').astype(str)
+    
+    # Same rules as the scalar parser: only plain digit strings count as numbers
+    for column, default in (('mood_score', 0), ('stress_level', 5), ('energy_level', 5)):
+        values = df[column].fillna('').astype(str)
+        df[column] = pd.to_numeric(values.where(values.str.fullmatch(r'[0-9]+'), str(default))).astype('int64')
+    
+    sleep = df['sleep_hours'].fillna('').astype(str)
+    sleep = pd.to_numeric(sleep.where(sleep.str.fullmatch(r'[0-9.]+')), errors='coerce')
+    df['sleep_hours'] = sleep.fillna(8.0).astype('float64')
+    
+    df['tags'] = df['tags'].map(lambda tags: [tag.strip() for tag in tags.split(',')] if tags else [])
+    
+    # Iterating columns yields Python scalars rather than NumPy ones
+    return [MoodRow(*values) for values in zip(*(df[column] for column in _COLUMNS))]
+
+if GOOGLE_API_AVAILABLE:
+    class GzipHttp(httplib2.Http):
+        """httplib2.Http that gzip-compresses request bodies above MIN_SIZE bytes"""
+        
+        MIN_SIZE = 1024
+        
+        def request(self, uri, method="GET", body=None, headers=None, *args, **kwargs):
+            if body and len(body) > self.MIN_SIZE:
+                if isinstance(body, str):
+                    body = body.encode('utf-8')
+                body = gzip.compress(body, compresslevel=1)
+                headers = {k: v for k, v in (headers or {}).items() if k.lower() != 'content-length'}
+                headers['content-encoding'] = 'gzip'
+                headers['content-length'] = str(len(body))
+            return super().request(uri, method, body, headers, *args, **kwargs)
+
+def _read_snapshot(path: str, filters=None) -> List[List]:
+    """Read sheet rows back from a Parquet snapshot written by SheetsAPI._sync_snapshot"""
+    table = pq.read_table(path, filters=filters)
+    # Missing trailing cells are stored as nulls; drop them to restore the rows as sent by the API
+    return [[value for value in row if value is not None]
+            for row in zip(*(table.column(column).to_pylist() for column in _COLUMNS))]
+
+def _retry_after(response) -> Optional[float]:
+    """Seconds to wait according to a Retry-After response header, if it has one"""
+    try:
+        return max(0.0, float(response.get('retry-after')))
+    except (TypeError, ValueError):
+        # Missing, or given as an HTTP date: use the regular backoff
+        return None
+
+# Connection errors raised before any part of the request reached the server;
+# httplib2 re-raises DNS failures (socket.gaierror) as ServerNotFoundError
+_UNSENT_ERRORS = (ConnectionRefusedError, socket.gaierror)
+if GOOGLE_API_AVAILABLE:
+    _UNSENT_ERRORS += (httplib2.ServerNotFoundError,)
+
+# Network errors worth retrying; ServerNotFoundError is not an OSError
+_CONNECTION_ERRORS = (socket.timeout, ConnectionError) + _UNSENT_ERRORS
+
+def _safe_to_resend(error: Exception) -> bool:
+    """Whether a failed write can be sent again later: it certainly had no effect (so
+    resending cannot duplicate it) and the failure is transient (rate limit, network)"""
+    if GOOGLE_API_AVAILABLE and isinstance(error, HttpError):
+        return error.resp.status == 429
+    return isinstance(error, _UNSENT_ERRORS)
+
+def _rejected(error: Exception) -> bool:
+    """Whether the API refused a request outright (4xx), so nothing was written"""
+    return GOOGLE_API_AVAILABLE and isinstance(error, HttpError) and error.resp.status < 500
+
+def _json_line(obj) -> bytes:
+    """Encode an object as one line of NDJSON"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode() + b'\n'
+
+def _json_dumps(obj) -> str:
+    """Encode an object as compact JSON text"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+def _json_loads(data):
+    """Decode JSON text or bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 class SheetsAPI:
     """Handle Google Sheets API operations for mood tracking data"""
     
     # Scopes for Google Sheets API
     SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
     
-    def __init__(self, spreadsheet_id: str = None, credentials_path: str = 'credentials.json'):
+    # Socket timeout (seconds) for the shared HTTP connection
+    HTTP_TIMEOUT = 60
+    
+    # Credentials shared by all instances, keyed by credentials_path
+    _CRED_CACHE: Dict[str, 'Credentials'] = {}
+    _CRED_CACHE_LOCK = threading.Lock()
+    # Cached credentials are only reused if they stay valid at least this long
+    CRED_MIN_LIFETIME = timedelta(seconds=60)
+    
+    # Live instances, flushed at interpreter exit without keeping them alive
+    _INSTANCES: 'weakref.WeakSet[SheetsAPI]' = weakref.WeakSet()
+    
+    # Retries for rate-limited (429), server-side (5xx) and connection failures
+    MAX_RETRIES = 5
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    RETRY_INITIAL_DELAY = 0.5  # seconds, doubled after every attempt
+    RETRY_MAX_DELAY = 30
+    
+    # get_sheet_info results shared by all instances, keyed by spreadsheet ID
+    _INFO_CACHE: Dict[str, tuple] = {}  # spreadsheet_id -> (expires_at, info)
+    _INFO_CACHE_LOCK = threading.Lock()
+    INFO_CACHE_TTL = 60  # seconds
+    
+    def __init__(self, spreadsheet_id: str = None, credentials_path: str = 'credentials.json',
+                 buffer_limit: int = 500, compress_requests: bool = False, cache_dir: str = None,
+                 flush_interval: float = 5.0):
         self.spreadsheet_id = spreadsheet_id or os.getenv('GOOGLE_SHEETS_ID')
         self.credentials_path = credentials_path
+        self.compress_requests = compress_requests  # gzip large request bodies (bulk appends)
+        # Directory for local Parquet snapshots of the sheets, e.g. '~/.cache/moodtracker';
+        # reads then only download rows appended since the last call (requires pyarrow)
+        self.cache_dir = cache_dir
         self.service = None
         self.creds = None
+        self.http = None
+        
+        # Rows waiting to be appended, per sheet name; sent in one request by flush()
+        self._pending_rows: Dict[str, List[List]] = {}
+        self._pending_count = 0
+        self._buffer_limit = buffer_limit
+        # Buffered rows are sent at most this many seconds after the first of them was queued
+        self.flush_interval = flush_interval
+        self._flush_timer = None
+        self._buffer_lock = threading.Lock()
+        self._INSTANCES.add(self)
         
         if not GOOGLE_API_AVAILABLE:
             print("Google Sheets API not available. Install required packages.")
@@ -36,12 +337,49 @@ class SheetsAPI:
         """Authenticate with Google Sheets API"""
         if not GOOGLE_API_AVAILABLE:
             return False
-            
+        
+        with self._CRED_CACHE_LOCK:
+            if not self._load_cached_credentials():
+                if not self._load_credentials():
+                    return False
+                self._CRED_CACHE[self.credentials_path] = self.creds
+        
+        try:
+            # One authorized HTTP object for every request, so the TLS connection is reused
+            self.http = self._new_http()
+            # static_discovery uses the discovery document bundled with the client
+            # library instead of downloading it on every start
+            self.service = build('sheets', 'v4', http=self.http, static_discovery=True)
+            return True
+        except Exception as e:
+            print(f"Error building service: {e}")
+            return False
+    
+    def _new_http(self) -> 'AuthorizedHttp':
+        """Create an authorized HTTP connection object (httplib2 objects are not thread-safe)"""
+        http_class = GzipHttp if self.compress_requests else httplib2.Http
+        return AuthorizedHttp(self.creds, http=http_class(timeout=self.HTTP_TIMEOUT))
+    
+    def _load_cached_credentials(self) -> bool:
+        """Reuse credentials already loaded by another instance, if they are not about to expire"""
+        cached = self._CRED_CACHE.get(self.credentials_path)
+        if not cached or not cached.valid:
+            return False
+        # google-auth stores expiry as a naive UTC datetime
+        if cached.expiry and cached.expiry - datetime.utcnow() < self.CRED_MIN_LIFETIME:
+            return False
+        
+        self.creds = cached
+        return True
+    
+    def _load_credentials(self) -> bool:
+        """Load credentials from token.json, refreshing or re-authorizing as needed"""
         token_path = 'token.json'
         
         # Load existing credentials if available
         if os.path.exists(token_path):
-            self.creds = Credentials.from_authorized_user_file(token_path, self.SCOPES)
+            with open(token_path, 'rb') as token:
+                self.creds = Credentials.from_authorized_user_info(_json_loads(token.read()), self.SCOPES)
         
         # If no valid credentials, prompt for authorization
         if not self.creds or not self.creds.valid:
@@ -69,12 +407,40 @@ class SheetsAPI:
             with open(token_path, 'w') as token:
                 token.write(self.creds.to_json())
         
-        try:
-            self.service = build('sheets', 'v4', credentials=self.creds)
-            return True
-        except Exception as e:
-            print(f"Error building service: {e}")
-            return False
+        return True
+    
+    def _execute(self, request, http=None, idempotent: bool = True):
+        """Execute an API request, retrying only that request on transient errors
+        
+        Waits with exponential backoff and jitter between attempts; for 429 and
+        503 responses a Retry-After header takes precedence. `http` overrides
+        the shared connection, for requests sent from worker threads.
+        
+        Non-idempotent requests (appends, adding a sheet) may already have been
+        applied when a 5xx or a connection error occurs, so they are only
+        retried after a 429 or an error raised before the request was sent.
+        """
+        delay = self.RETRY_INITIAL_DELAY
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                return request.execute(http=http)
+            except HttpError as e:
+                if idempotent:
+                    retry = e.resp.status in self.RETRY_STATUSES
+                else:
+                    retry = e.resp.status == 429
+                if attempt == self.MAX_RETRIES or not retry:
+                    raise
+                wait = _retry_after(e.resp)
+            except _CONNECTION_ERRORS as e:
+                if attempt == self.MAX_RETRIES or not (idempotent or isinstance(e, _UNSENT_ERRORS)):
+                    raise
+                wait = None
+            
+            if wait is None:
+                wait = delay + random.uniform(0, delay)
+            time.sleep(min(wait, self.RETRY_MAX_DELAY))
+            delay = min(delay * 2, self.RETRY_MAX_DELAY)
     
     def is_connected(self) -> bool:
         """Check if API is properly connected"""
@@ -86,37 +452,38 @@ class SheetsAPI:
             return False
             
         try:
-            # Create new sheet
+            # Pick the new sheet's ID ourselves so the header row can be written in the
+            # same batchUpdate; the whole request is applied atomically
+            sheet_id = random.randrange(1, 2 ** 31)
             body = {
-                'requests': [{
-                    'addSheet': {
-                        'properties': {
-                            'title': sheet_name
+                'requests': [
+                    {
+                        'addSheet': {
+                            'properties': {
+                                'sheetId': sheet_id,
+                                'title': sheet_name
+                            }
+                        }
+                    },
+                    {
+                        'updateCells': {
+                            'start': {'sheetId': sheet_id, 'rowIndex': 0, 'columnIndex': 0},
+                            'rows': [{
+                                'values': [{'userEnteredValue': {'stringValue': header}}
+                                           for header in _HEADERS]
+                            }],
+                            'fields': 'userEnteredValue'
                         }
                     }
-                }]
+                ]
             }
             
-            self.service.spreadsheets().batchUpdate(
-                spreadsheetId=self.spreadsheet_id, body=body).execute()
-            
-            # Add headers
-            headers = [
-                'Timestamp', 'Date', 'Time', 'Mood Score', 'Stress Level',
-                'Energy Level', 'Sleep Hours', 'Notes', 'Tags'
-            ]
+            self._execute(self.service.spreadsheets().batchUpdate(
+                spreadsheetId=self.spreadsheet_id, body=body), idempotent=False)
             
-            range_name = f"{sheet_name}!A1:I1"
-            body = {
-                'values': [headers]
-            }
-            
-            self.service.spreadsheets().values().update(
-                spreadsheetId=self.spreadsheet_id,
-                range=range_name,
-                valueInputOption='RAW',
-                body=body
-            ).execute()
+            # The sheet list changed
+            with self._INFO_CACHE_LOCK:
+                self._INFO_CACHE.pop(self.spreadsheet_id, None)
             
             print(f"Created sheet '{sheet_name}' with headers")
             return True
@@ -125,99 +492,268 @@ class SheetsAPI:
             print(f"Error creating sheet: {e}")
             return False
     
-    def add_mood_entry(self, mood_entry, sheet_name: str = "MoodTracker") -> bool:
-        """Add a single mood entry to the sheet"""
+    def _queue_rows(self, rows: List[List], sheet_name: str) -> None:
+        """Add rows to the write buffer, scheduling a timed flush if it was empty"""
+        with self._buffer_lock:
+            self._pending_rows.setdefault(sheet_name, []).extend(rows)
+            self._pending_count += len(rows)
+            if self._flush_timer is None and self.flush_interval:
+                self._flush_timer = threading.Timer(self.flush_interval, self._flush_on_timer)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def _flush_on_timer(self) -> None:
+        """Timed flush; runs on the timer thread, so it uses its own connection"""
+        self.flush(http=self._new_http())
+    
+    @classmethod
+    def _flush_all(cls) -> None:
+        """Flush every live instance (registered with atexit)"""
+        for instance in list(cls._INSTANCES):
+            instance.flush()
+    
+    def flush(self, http=None) -> bool:
+        """Append all buffered rows to their sheets, one request per sheet
+        
+        Rows whose append failed transiently (see _safe_to_resend) stay buffered
+        for the next flush. Returns False if rows had to be dropped instead.
+        """
+        with self._buffer_lock:
+            pending, self._pending_rows = self._pending_rows, {}
+            self._pending_count = 0
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        
+        if not pending:
+            return True
         if not self.is_connected():
             return False
-            
+        
+        success = True
+        for sheet_name, rows in pending.items():
+            try:
+                self._append_rows(rows, sheet_name, http=http)
+            except Exception as e:
+                print(f"Error flushing {len(rows)} entries to '{sheet_name}': {e}")
+                success = self._requeue_failed(rows, sheet_name, e) and success
+        
+        return success
+    
+    def _requeue_failed(self, rows: List[List], sheet_name: str, error: Exception) -> bool:
+        """Buffer the rows of a failed append again if that is safe (returns True);
+        otherwise report and drop them (returns False)"""
+        if _safe_to_resend(error):
+            self._queue_rows(rows, sheet_name)
+            return True
+        if _rejected(error):
+            # e.g. a bad range or missing sheet: resending would fail the same way
+            print(f"{len(rows)} entries were not written to '{sheet_name}' and are dropped")
+        else:
+            # Resending could duplicate them if the append went through
+            print(f"{len(rows)} entries may not have been written to '{sheet_name}'")
+        return False
+    
+    def _append_rows(self, rows: List[List], sheet_name: str, http=None) -> None:
+        """Append rows to a sheet in one request"""
+        range_name = f"{sheet_name}!A:I"
+        body = {
+            'values': rows
+        }
+        
+        self._execute(self.service.spreadsheets().values().append(
+            spreadsheetId=self.spreadsheet_id,
+            range=range_name,
+            valueInputOption='RAW',
+            insertDataOption='INSERT_ROWS',
+            body=body
+        ), http=http, idempotent=False)
+    
+    def _append_shard(self, rows: List[List], sheet_name: str) -> bool:
+        """Append one shard of rows over its own connection; True if written or
+        buffered for flush(), False if dropped"""
         try:
-            # Convert mood entry to row data
-            timestamp = mood_entry.timestamp
-            row_data = [
-                timestamp.isoformat(),
-                timestamp.strftime('%Y-%m-%d'),
-                timestamp.strftime('%H:%M:%S'),
-                mood_entry.mood_score,
-                mood_entry.stress_level,
-                mood_entry.energy_level,
-                mood_entry.sleep_hours,
-                mood_entry.notes,
-                ', '.join(mood_entry.tags) if mood_entry.tags else ''
-            ]
-            
-            # Append to sheet
-            range_name = f"{sheet_name}!A:I"
-            body = {
-                'values': [row_data]
-            }
-            
-            self.service.spreadsheets().values().append(
-                spreadsheetId=self.spreadsheet_id,
-                range=range_name,
-                valueInputOption='RAW',
-                insertDataOption='INSERT_ROWS',
-                body=body
-            ).execute()
-            
+            self._append_rows(rows, sheet_name, http=self._new_http())
             return True
+        except Exception as e:
+            print(f"Error adding {len(rows)} entries to '{sheet_name}': {e}")
+            return self._requeue_failed(rows, sheet_name, e)
+    
+    def add_mood_entry(self, mood_entry, sheet_name: str = "MoodTracker") -> bool:
+        """Buffer a single mood entry; rows are sent once the buffer fills, after
+        flush_interval seconds, or on flush(). Returns False only if the entry
+        was not kept (see flush())."""
+        if not self.is_connected():
+            return False
             
+        try:
+            self._queue_rows([_entry_to_row(mood_entry)], sheet_name)
         except Exception as e:
             print(f"Error adding mood entry: {e}")
             return False
+        
+        if self._pending_count >= self._buffer_limit:
+            return self.flush()
+        return True
     
     def add_multiple_entries(self, mood_entries: List, sheet_name: str = "MoodTracker") -> bool:
-        """Add multiple mood entries to the sheet"""
+        """Add multiple mood entries to the sheet
+        
+        Returns True once the entries are written, or buffered for the next
+        flush() after a transient failure (rate limit, connection refused).
+        False means they were not kept; they may still have been written if
+        the error came after the request was sent.
+        """
         if not self.is_connected():
             return False
             
         try:
-            # Convert all entries to row data
-            rows_data = []
-            for entry in mood_entries:
-                timestamp = entry.timestamp
-                row_data = [
-                    timestamp.isoformat(),
-                    timestamp.strftime('%Y-%m-%d'),
-                    timestamp.strftime('%H:%M:%S'),
-                    entry.mood_score,
-                    entry.stress_level,
-                    entry.energy_level,
-                    entry.sleep_hours,
-                    entry.notes,
-                    ', '.join(entry.tags) if entry.tags else ''
-                ]
-                rows_data.append(row_data)
-            
-            # Append all rows to sheet
-            range_name = f"{sheet_name}!A:I"
-            body = {
-                'values': rows_data
-            }
-            
-            self.service.spreadsheets().values().append(
-                spreadsheetId=self.spreadsheet_id,
-                range=range_name,
-                valueInputOption='RAW',
-                insertDataOption='INSERT_ROWS',
-                body=body
-            ).execute()
-            
-            print(f"Added {len(mood_entries)} entries to sheet")
-            return True
-            
+            rows = _entries_to_rows(mood_entries)
+        except Exception as e:
+            print(f"Error adding multiple entries: {e}")
+            return False
+        
+        # Send these rows together with the ones already buffered for this sheet
+        with self._buffer_lock:
+            buffered = self._pending_rows.pop(sheet_name, [])
+            self._pending_count -= len(buffered)
+        rows = buffered + rows
+        
+        try:
+            self._append_rows(rows, sheet_name)
+        except Exception as e:
+            print(f"Error adding multiple entries: {e}")
+            return self._requeue_failed(rows, sheet_name, e)
+        
+        print(f"Added {len(mood_entries)} entries to sheet")
+        return True
+    
+    def add_multiple_entries_parallel(self, mood_entries: List, sheet_name: str = "MoodTracker",
+                                      shards: int = 4) -> bool:
+        """Add a large batch of mood entries as `shards` concurrent append requests
+        
+        Keeps each request well below the Sheets request size limit and overlaps
+        their round-trips.
+        
+        Warning: the shards may land in any order, so with more than one shard the
+        sheet's rows stop being in date order. From then on date-range reads for
+        that sheet cannot bisect column B and download the whole sheet instead.
+        Use add_multiple_entries when the sheet should stay chronological.
+        
+        Returns True once every shard is written or buffered for the next flush()
+        after a transient failure. False means at least one shard was dropped;
+        the other shards may have been written, so do not resend the whole batch.
+        """
+        if shards < 1:
+            print(f"Invalid number of shards: {shards}")
+            return False
+        if not self.is_connected():
+            return False
+        
+        try:
+            rows = _entries_to_rows(mood_entries)
         except Exception as e:
             print(f"Error adding multiple entries: {e}")
             return False
+        
+        # Send previously buffered rows first; their outcome was reported by earlier calls
+        self.flush()
+        success = True
+        
+        size = -(-len(rows) // shards) or 1
+        chunks = [rows[i:i + size] for i in range(0, len(rows), size)]
+        if len(chunks) > 1:
+            warnings.warn(f"add_multiple_entries_parallel may store rows of '{sheet_name}' out of "
+                          "date order, which disables bisected date-range reads for that sheet",
+                          stacklevel=2)
+        if chunks:
+            with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+                results = list(executor.map(lambda chunk: self._append_shard(chunk, sheet_name), chunks))
+            success = all(results)
+        
+        if success:
+            print(f"Added {len(mood_entries)} entries to sheet")
+        return success
     
-    def get_all_entries(self, sheet_name: str = "MoodTracker") -> List[Dict]:
-        """Retrieve all mood entries from the sheet"""
+    def _snapshot_path(self, sheet_name: str) -> Optional[str]:
+        """Path of the Parquet snapshot for a sheet; None if snapshots are disabled"""
+        if not self.cache_dir or not PYARROW_AVAILABLE:
+            return None
+        return os.path.join(os.path.expanduser(self.cache_dir),
+                            f"{self.spreadsheet_id}_{quote(sheet_name, safe='')}.parquet")
+    
+    def _sync_snapshot(self, sheet_name: str) -> Optional[str]:
+        """Bring the Parquet snapshot of a sheet up to date and return its path
+        
+        Only rows below the cached ones are downloaded. The last cached row is
+        fetched again as a check: if it no longer matches (the sheet was cleared
+        or rewritten), the whole sheet is downloaded instead. Edits to earlier
+        rows are not detected.
+        """
+        path = self._snapshot_path(sheet_name)
+        if path is None:
+            return None
+        
+        table = pq.read_table(path) if os.path.exists(path) else None
+        cached = table.num_rows if table is not None else 0
+        
+        if cached:
+            # Data row k is sheet row k + 1 (row 1 holds the headers)
+            rows = self._get_rows_from(sheet_name, cached + 1)
+            last_row = [value for value in table.slice(cached - 1).to_pylist()[0].values()
+                        if value is not None]
+            if rows and rows[0] == last_row:
+                rows = rows[1:]
+            else:
+                table = None
+                rows = self._get_rows_from(sheet_name, 2)
+        else:
+            rows = self._get_rows_from(sheet_name, 2)
+        
+        if table is not None and not rows:
+            return path
+        
+        new_rows = pa.table({column: [row[i] if i < len(row) else None for row in rows]
+                             for i, column in enumerate(_COLUMNS)}, schema=_SNAPSHOT_SCHEMA)
+        if table is not None:
+            new_rows = pa.concat_tables([table, new_rows])
+        
+        # Write to a uniquely named temporary file first, so readers never see a partial
+        # snapshot and concurrent writers sharing cache_dir cannot replace each other's
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.parquet.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pq.write_table(new_rows, f, row_group_size=_SNAPSHOT_ROW_GROUP_SIZE)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return path
+    
+    def _get_rows_from(self, sheet_name: str, start: int) -> List[List]:
+        """Fetch all rows (columns A:I) from 1-based sheet row `start` to the end of the sheet"""
+        result = self._execute(self.service.spreadsheets().values().get(
+            spreadsheetId=self.spreadsheet_id, range=f"{sheet_name}!A{start}:I"))
+        return result.get('values', [])
+    
+    def get_all_entries(self, sheet_name: str = "MoodTracker") -> List[MoodRow]:
+        """Retrieve all mood entries from the sheet, as MoodRow objects"""
         if not self.is_connected():
             return []
+        
+        # Make buffered writes visible to the read
+        self.flush()
             
         try:
+            snapshot = self._sync_snapshot(sheet_name)
+            if snapshot:
+                return _parse_rows(_read_snapshot(snapshot))
+            
             range_name = f"{sheet_name}!A:I"
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.spreadsheet_id, range=range_name).execute()
+            result = self._execute(self.service.spreadsheets().values().get(
+                spreadsheetId=self.spreadsheet_id, range=range_name))
             
             values = result.get('values', [])
             
@@ -225,58 +761,102 @@ class SheetsAPI:
                 return []
             
             # Skip header row
-            data_rows = values[1:] if len(values) > 1 else []
-            
-            entries = []
-            for row in data_rows:
-                if len(row) >= 4:  # Minimum required columns
-                    entry = {
-                        'timestamp': row[0] if len(row) > 0 else '',
-                        'date': row[1] if len(row) > 1 else '',
-                        'time': row[2] if len(row) > 2 else '',
-                        'mood_score': int(row[3]) if len(row) > 3 and row[3].isdigit() else 0,
-                        'stress_level': int(row[4]) if len(row) > 4 and row[4].isdigit() else 5,
-                        'energy_level': int(row[5]) if len(row) > 5 and row[5].isdigit() else 5,
-                        'sleep_hours': float(row[6]) if len(row) > 6 and row[6].replace('.', '').isdigit() else 8.0,
-                        'notes': row[7] if len(row) > 7 else '',
-                        'tags': [tag.strip() for tag in row[8].split(',')] if len(row) > 8 and row[8] else []
-                    }
-                    entries.append(entry)
-            
-            return entries
+            return _parse_rows(values[1:])
             
         except Exception as e:
             print(f"Error retrieving entries: {e}")
             return []
     
+    def _get_sorted_dates(self, sheet_name: str) -> Optional[List[str]]:
+        """Fetch the date column (B) of all data rows; None if it is not in chronological order"""
+        result = self._execute(self.service.spreadsheets().values().get(
+            spreadsheetId=self.spreadsheet_id, range=f"{sheet_name}!B2:B"))
+        
+        dates = [row[0] if row else '' for row in result.get('values', [])]
+        if any(a > b for a, b in zip(dates, dates[1:])):
+            return None
+        return dates
+    
     def get_entries_by_date_range(self, start_date: str, end_date: str, 
-                                 sheet_name: str = "MoodTracker") -> List[Dict]:
+                                 sheet_name: str = "MoodTracker") -> List[MoodRow]:
         """Get entries within a specific date range"""
-        all_entries = self.get_all_entries(sheet_name)
+        return self.get_entries_by_date_ranges([(start_date, end_date)], sheet_name)[0]
+    
+    def get_entries_by_date_ranges(self, date_ranges: List[Tuple[str, str]],
+                                   sheet_name: str = "MoodTracker") -> List[List[MoodRow]]:
+        """Get the entries for several (start_date, end_date) ranges, one list per range
+        
+        All ranges are fetched in a single batchGet request.
+        """
+        if not self.is_connected():
+            return [[] for _ in date_ranges]
+        
+        # Make buffered writes visible to the read
+        self.flush()
+        
+        try:
+            snapshot = self._sync_snapshot(sheet_name)
+            if snapshot:
+                # Served locally; when rows are in date order, row groups outside the range
+                # are skipped using their min/max statistics
+                return [_parse_rows(_read_snapshot(
+                            snapshot, filters=[('date', '>=', start_date), ('date', '<=', end_date)]))
+                        for start_date, end_date in date_ranges]
+            
+            # Rows are appended in time order, so the ISO dates in column B are sorted:
+            # probe that column and fetch only the matching block of rows for each range
+            dates = self._get_sorted_dates(sheet_name)
+            if dates is not None:
+                results = [[] for _ in date_ranges]
+                wanted = {}  # index in date_ranges -> A1 range
+                for i, (start_date, end_date) in enumerate(date_ranges):
+                    first = bisect_left(dates, start_date)
+                    last = bisect_right(dates, end_date)
+                    if first < last:
+                        # +2: sheet rows are 1-based and row 1 holds the headers
+                        wanted[i] = f"{sheet_name}!A{first + 2}:I{last + 1}"
+                
+                if len(wanted) == 1:
+                    (i, range_name), = wanted.items()
+                    result = self._execute(self.service.spreadsheets().values().get(
+                        spreadsheetId=self.spreadsheet_id, range=range_name))
+                    results[i] = _parse_rows(result.get('values', []))
+                elif wanted:
+                    result = self._execute(self.service.spreadsheets().values().batchGet(
+                        spreadsheetId=self.spreadsheet_id, ranges=list(wanted.values()),
+                        majorDimension='ROWS'))
+                    for i, value_range in zip(wanted, result.get('valueRanges', [])):
+                        results[i] = _parse_rows(value_range.get('values', []))
+                return results
+            
+        except Exception as e:
+            print(f"Error retrieving entries: {e}")
+            return [[] for _ in date_ranges]
         
-        filtered_entries = []
-        for entry in all_entries:
-            entry_date = entry.get('date', '')
-            if start_date <= entry_date <= end_date:
-                filtered_entries.append(entry)
+        # Sheet is not chronological (e.g. back-filled data): filter everything
+        all_entries = self.get_all_entries(sheet_name)
         
-        return filtered_entries
+        return [[entry for entry in all_entries if start_date <= entry.date <= end_date]
+                for start_date, end_date in date_ranges]
     
     def clear_sheet(self, sheet_name: str = "MoodTracker") -> bool:
         """Clear all data from the sheet (except headers)"""
         if not self.is_connected():
             return False
             
+        # Send buffered rows first so they are cleared too
+        self.flush()
+        
         try:
             # Clear all data except header row
             range_name = f"{sheet_name}!A2:Z"
             body = {}
             
-            self.service.spreadsheets().values().clear(
+            self._execute(self.service.spreadsheets().values().clear(
                 spreadsheetId=self.spreadsheet_id,
                 range=range_name,
                 body=body
-            ).execute()
+            ))
             
             print(f"Cleared data from sheet '{sheet_name}'")
             return True
@@ -285,16 +865,85 @@ class SheetsAPI:
             print(f"Error clearing sheet: {e}")
             return False
     
-    def backup_to_file(self, filename: str = None, sheet_name: str = "MoodTracker") -> bool:
-        """Backup sheet data to a JSON file"""
+    def _get_rows(self, sheet_name: str, start: int, count: int,
+                  value_render_option: str = 'FORMATTED_VALUE') -> List[List]:
+        """Fetch `count` rows (columns A:I) starting at 1-based sheet row `start`"""
+        range_name = f"{sheet_name}!A{start}:I{start + count - 1}"
+        result = self._execute(self.service.spreadsheets().values().get(
+            spreadsheetId=self.spreadsheet_id, range=range_name,
+            valueRenderOption=value_render_option))
+        return result.get('values', [])
+    
+    def backup_to_file(self, filename: str = None, sheet_name: str = "MoodTracker",
+                       chunk: int = 5000) -> bool:
+        """Backup sheet data to a newline-delimited JSON file (one entry per line)
+        
+        The sheet is read in pages of `chunk` rows; the next page is fetched
+        while the current one is written, so memory use stays flat.
+        """
+        if not filename:
+            filename = f"mood_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+        
+        if not self.is_connected():
+            return False
+        
+        # Make buffered writes part of the backup
+        self.flush()
+        
+        try:
+            with open(filename, 'wb', buffering=1 << 20) as f, \
+                    ThreadPoolExecutor(max_workers=1) as prefetch:
+                start = 2  # skip header row
+                page = prefetch.submit(self._get_rows, sheet_name, start, chunk)
+                while True:
+                    rows = page.result()
+                    if not rows:
+                        break
+                    start += chunk
+                    page = prefetch.submit(self._get_rows, sheet_name, start, chunk)
+                    
+                    for entry in _parse_rows(rows):
+                        f.write(_json_line(entry.as_dict()))
+            
+            print(f"Backup saved to {filename}")
+            return True
+            
+        except Exception as e:
+            print(f"Error creating backup: {e}")
+            return False
+    
+    def backup_to_csv(self, filename: str = None, sheet_name: str = "MoodTracker",
+                      chunk: int = 10000) -> bool:
+        """Backup sheet data to a gzip-compressed CSV file
+        
+        Rows are written as the sheet stores them (unformatted values), page by
+        page like backup_to_file, without parsing them into entries first.
+        """
         if not filename:
-            filename = f"mood_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            filename = f"mood_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv.gz"
+        
+        if not self.is_connected():
+            return False
         
-        entries = self.get_all_entries(sheet_name)
+        # Make buffered writes part of the backup
+        self.flush()
         
         try:
-            with open(filename, 'w') as f:
-                json.dump(entries, f, indent=2)
+            with gzip.open(filename, 'wt', compresslevel=1, encoding='utf-8', newline='') as f, \
+                    ThreadPoolExecutor(max_workers=1) as prefetch:
+                writer = csv.writer(f)
+                writer.writerow(_HEADERS)
+                
+                start = 2  # skip header row
+                page = prefetch.submit(self._get_rows, sheet_name, start, chunk, 'UNFORMATTED_VALUE')
+                while True:
+                    rows = page.result()
+                    if not rows:
+                        break
+                    start += chunk
+                    page = prefetch.submit(self._get_rows, sheet_name, start, chunk, 'UNFORMATTED_VALUE')
+                    
+                    writer.writerows(rows)
             
             print(f"Backup saved to {filename}")
             return True
@@ -304,13 +953,18 @@ class SheetsAPI:
             return False
     
     def get_sheet_info(self) -> Dict:
-        """Get information about the spreadsheet"""
+        """Get information about the spreadsheet (cached for INFO_CACHE_TTL seconds)"""
         if not self.is_connected():
             return {}
+        
+        with self._INFO_CACHE_LOCK:
+            cached = self._INFO_CACHE.get(self.spreadsheet_id)
+        if cached and cached[0] > time.monotonic():
+            return {**cached[1], 'sheets': list(cached[1]['sheets'])}
             
         try:
-            spreadsheet = self.service.spreadsheets().get(
-                spreadsheetId=self.spreadsheet_id).execute()
+            spreadsheet = self._execute(self.service.spreadsheets().get(
+                spreadsheetId=self.spreadsheet_id))
             
             info = {
                 'title': spreadsheet.get('properties', {}).get('title', 'Unknown'),
@@ -318,12 +972,91 @@ class SheetsAPI:
                 'spreadsheet_id': self.spreadsheet_id
             }
             
-            return info
+            with self._INFO_CACHE_LOCK:
+                self._INFO_CACHE[self.spreadsheet_id] = (time.monotonic() + self.INFO_CACHE_TTL, info)
+            return {**info, 'sheets': list(info['sheets'])}
             
         except Exception as e:
             print(f"Error getting sheet info: {e}")
             return {}
 
+atexit.register(SheetsAPI._flush_all)
+
+class SheetsAPIAsync:
+    """Asynchronous Google Sheets client for running many reads/writes concurrently
+    
+    Usage:
+        async with SheetsAPIAsync(sheets_api.creds, spreadsheet_id) as api:
+            await asyncio.gather(*[api.add_mood_entry(e) for e in entries])
+    """
+    
+    BASE_URL = 'https://sheets.googleapis.com/v4/spreadsheets'
+    
+    def __init__(self, creds, spreadsheet_id: str = None, max_concurrency: int = 10):
+        self.spreadsheet_id = spreadsheet_id or os.getenv('GOOGLE_SHEETS_ID')
+        self.creds = creds
+        self.max_concurrency = max_concurrency  # stay within the Sheets request quota
+        self._session = None
+        self._semaphore = None
+        self._refresh_lock = None
+    
+    async def __aenter__(self) -> 'SheetsAPIAsync':
+        if not AIOHTTP_AVAILABLE:
+            raise RuntimeError("aiohttp is not installed. Install with: pip install aiohttp")
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300),
+            json_serialize=_json_dumps)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._refresh_lock = asyncio.Lock()
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self._session.close()
+        self._session = None
+    
+    async def _headers(self) -> Dict[str, str]:
+        """Authorization headers, refreshing the access token if needed"""
+        async with self._refresh_lock:
+            if not self.creds.valid:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(None, self.creds.refresh, Request())
+        return {'Authorization': f'Bearer {self.creds.token}'}
+    
+    async def _request(self, method: str, path: str, **kwargs) -> Dict:
+        """Send a request to the Sheets values API and return the JSON response"""
+        url = f"{self.BASE_URL}/{self.spreadsheet_id}/values/{path}"
+        async with self._semaphore:
+            async with self._session.request(method, url, headers=await self._headers(),
+                                             **kwargs) as response:
+                response.raise_for_status()
+                return await response.json(loads=_json_loads)
+    
+    async def add_mood_entry(self, mood_entry, sheet_name: str = "MoodTracker") -> bool:
+        """Append a single mood entry to the sheet"""
+        try:
+            await self._request(
+                'POST', f"{quote(f'{sheet_name}!A:I', safe='')}:append",
+                params={'valueInputOption': 'RAW', 'insertDataOption': 'INSERT_ROWS'},
+                json={'values': [_entry_to_row(mood_entry)]}
+            )
+            return True
+            
+        except Exception as e:
+            print(f"Error adding mood entry: {e}")
+            return False
+    
+    async def get_all_entries(self, sheet_name: str = "MoodTracker") -> List[MoodRow]:
+        """Retrieve all mood entries from the sheet, as MoodRow objects"""
+        try:
+            result = await self._request('GET', quote(f'{sheet_name}!A:I', safe=''))
+            
+            # Skip header row
+            return _parse_rows(result.get('values', [])[1:])
+            
+        except Exception as e:
+            print(f"Error retrieving entries: {e}")
+            return []
+
 # Utility function to setup Google Sheets integration
 def setup_sheets_integration(spreadsheet_id: str = None) -> Optional[SheetsAPI]:
     """Setup and test Google Sheets integration"""